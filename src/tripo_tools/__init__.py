@@ -8,7 +8,19 @@ Usage:
     client.image_to_3d("photo.png", "model.glb")
 """
 
-from .client import TripoClient
+from .client import (
+    TripoClient,
+    get_default_client,
+    image_to_3d,
+    text_to_3d,
+    multiview_to_3d,
+)
 
 __version__ = "0.1.0"
-__all__ = ["TripoClient"]
+__all__ = [
+    "TripoClient",
+    "get_default_client",
+    "image_to_3d",
+    "text_to_3d",
+    "multiview_to_3d",
+]
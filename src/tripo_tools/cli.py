@@ -13,7 +13,10 @@ import os
 import sys
 from pathlib import Path
 
-from .client import TripoClient, MODEL_VERSIONS, GEOMETRY_QUALITIES
+from .client import (
+    TripoClient, MODEL_VERSIONS, GEOMETRY_QUALITIES, DOWNLOAD_CHUNK_SIZE,
+    DEFAULT_CACHE_DIR,
+)
 
 
 def print_progress(progress, status):
@@ -24,6 +27,26 @@ def print_progress(progress, status):
     print(f"\r[tripo] [{bar}] {progress}% — {status}", end="", flush=True)
 
 
+def make_download_progress():
+    """Return a download callback that prints MB downloaded to the terminal."""
+    state = {}
+
+    def print_download_progress(downloaded, total):
+        if "total_mb" not in state:
+            # Finish the poll progress line and compute the total once
+            print()
+            state["total_mb"] = total / (1024 * 1024)
+        mb = downloaded / (1024 * 1024)
+        if total:
+            pct = int(100 * downloaded / total)
+            print(f"\r[tripo] Downloaded: {mb:.1f} / {state['total_mb']:.1f} MB ({pct}%)",
+                  end="", flush=True)
+        else:
+            print(f"\r[tripo] Downloaded: {mb:.1f} MB", end="", flush=True)
+
+    return print_download_progress
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Tripo AI — Image-to-3D and Text-to-3D generation",
@@ -64,6 +87,11 @@ Examples:
                              "(only for model_version >= v3.0-20250812, default: standard)")
     parser.add_argument("--timeout", "-t", type=int, default=600,
                         help="Max wait time in seconds (default: 600)")
+    parser.add_argument("--download-chunk-size", type=int, default=DOWNLOAD_CHUNK_SIZE,
+                        help=f"Bytes per read when downloading the model "
+                             f"(default: {DOWNLOAD_CHUNK_SIZE})")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Don't reuse cached upload tokens or resume cached tasks")
     parser.add_argument("--quiet", "-q", action="store_true",
                         help="Suppress progress output")
     parser.add_argument("--version", "-v", action="store_true",
@@ -77,6 +105,10 @@ Examples:
         print(f"tripo-tools {__version__}")
         return 0
 
+    if args.download_chunk_size <= 0:
+        print("[tripo] ERROR: --download-chunk-size must be positive")
+        return 1
+
     # Get API key
     api_key = args.api_key or os.environ.get("TRIPO_API_KEY")
     if not api_key:
@@ -84,7 +116,11 @@ Examples:
         return 1
 
     try:
-        client = TripoClient(api_key)
+        client = TripoClient(
+            api_key,
+            download_chunk_size=args.download_chunk_size,
+            cache_dir=None if args.no_cache else DEFAULT_CACHE_DIR,
+        )
     except ValueError as e:
         print(f"[tripo] ERROR: {e}")
         return 1
@@ -126,8 +162,11 @@ Examples:
     if not output_path.lower().endswith(expected_ext):
         output_path = str(Path(output_path).with_suffix(expected_ext))
 
-    # Progress callback
+    # Progress callbacks. Download progress is redrawn in place, so skip it
+    # when stdout is piped and print a one-line summary at the end instead.
     callback = None if args.quiet else print_progress
+    interactive = sys.stdout.isatty()
+    download_callback = make_download_progress() if callback and interactive else None
 
     # Determine mode and run
     if args.image:
@@ -147,14 +186,20 @@ Examples:
     try:
         if args.image:
             client.image_to_3d(args.image, output_path, args.format, callback,
-                               model_version=mv, geometry_quality=gq)
+                               model_version=mv, geometry_quality=gq,
+                               download_callback=download_callback)
         elif args.prompt:
             client.text_to_3d(args.prompt, output_path, args.format, callback,
-                              model_version=mv, geometry_quality=gq)
+                              model_version=mv, geometry_quality=gq,
+                              download_callback=download_callback)
         else:
             client.multiview_to_3d(args.multiview, output_path, args.format, callback,
-                                   model_version=mv, geometry_quality=gq)
+                                   model_version=mv, geometry_quality=gq,
+                                   download_callback=download_callback)
 
+        if not args.quiet and not interactive:
+            mb = os.path.getsize(output_path) / (1024 * 1024)
+            print(f"\n[tripo] Downloaded: {mb:.1f} MB")
         print(f"\n[tripo] ✓ Done! Saved to {output_path}")
         return 0
 
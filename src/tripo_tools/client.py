@@ -4,9 +4,23 @@ Tripo AI API Client.
 The core client for interacting with Tripo's 3D generation API.
 """
 
+import hashlib
+import json
+import mimetypes
 import os
+import shutil
+import threading
 import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from urllib.parse import urlparse
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 
 API_BASE = "https://api.tripo3d.ai/v2/openapi"
 
@@ -26,32 +40,281 @@ MODEL_VERSIONS = [
 # Geometry quality options (only valid for model_version >= v3.0-20250812)
 GEOMETRY_QUALITIES = ["standard", "detailed"]
 
+# Bytes per read when streaming a model download
+DOWNLOAD_CHUNK_SIZE = 128 * 1024
+
+# Minimum bytes downloaded between download progress callbacks
+DOWNLOAD_REPORT_BYTES = 1024 * 1024
+
+# Concurrent requests for batch task creation and polling
+BATCH_WORKERS = 8
+
+# On-disk cache of upload tokens and in-flight task IDs, so a re-run after a
+# failure doesn't re-upload the same image or pay for the same task twice
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "tripo")
+CACHE_MAX_AGE = 24 * 60 * 60
+
+# Seconds a get_balance result is reused before asking the server again
+BALANCE_CACHE_TTL = 10
+
+# Connection pool and retry policy shared by every request on the session.
+# Only idempotent GETs are retried on error statuses so a flaky gateway can't
+# create (and bill) the same task twice; connection failures are retried for
+# all methods since the request never reached the server.
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 20
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def _make_retry():
+    return Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        raise_on_status=False,
+    )
+
+
+# Seconds the background warm-up HEAD may take before it's abandoned
+WARM_UP_TIMEOUT = 3
+
+# Model files aren't JSON; don't send the API's Accept header to the CDN
+_DOWNLOAD_HEADERS = {"Accept": "*/*"}
+
+
+def _model_url(output):
+    """Pick the model URL from a task's output dict, or None."""
+    model_url = output.get("model")
+    if not model_url:
+        for key in ["pbr_model", "base_model", "model"]:
+            if key in output and output[key]:
+                model_url = output[key]
+                break
+    return model_url
+
+
+def _make_output_dir(output_path):
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+
+
+class _MultipartFileBody:
+    """
+    Streaming multipart/form-data body for a single file field.
+
+    Reads the file in chunks as the request is sent instead of encoding the
+    whole body in memory. Defines __len__ so requests sends a Content-Length
+    up front, and is re-iterable so a retried request sends the full body.
+    """
+
+    def __init__(self, field, fileobj, filename, content_type, chunk_size=64 * 1024):
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self._file = fileobj
+        self._chunk_size = chunk_size
+        filename = filename.replace('"', "%22")
+        self._head = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode("utf-8")
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode("utf-8")
+        self._size = os.fstat(fileobj.fileno()).st_size
+
+    def __len__(self):
+        return len(self._head) + self._size + len(self._tail)
+
+    def __iter__(self):
+        self._file.seek(0)
+        yield self._head
+        while True:
+            chunk = self._file.read(self._chunk_size)
+            if not chunk:
+                break
+            yield chunk
+        yield self._tail
+
 
 class TripoClient:
     """Client for Tripo's 3D generation API."""
 
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, download_chunk_size=DOWNLOAD_CHUNK_SIZE,
+                 cache_dir=DEFAULT_CACHE_DIR):
         """
         Initialize the Tripo client.
         
         Args:
             api_key: Tripo API key. If not provided, reads from TRIPO_API_KEY env var.
+            download_chunk_size: Bytes per read when downloading models
+            cache_dir: Directory for cached upload tokens and task IDs, or None
+                to disable caching
         """
         self.api_key = api_key or os.environ.get("TRIPO_API_KEY")
         if not self.api_key:
             raise ValueError("API key required. Pass api_key or set TRIPO_API_KEY env var.")
+
+        self.download_chunk_size = download_chunk_size
+        self.cache_dir = cache_dir
+        self._task_cache_keys = {}
+        self._upload_cache_keys = {}
+        self._balance_cache = None
         
         self.session = requests.Session()
         self.session.headers.update({
             "Authorization": f"Bearer {self.api_key}",
+            "Accept": "application/json",
+            # gzip/deflate, plus br when a brotli decoder is installed
+            **make_headers(accept_encoding=True),
         })
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=_make_retry(),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Same connection pool, but no retries: the warm-up is disposable
+        self._warm_up_adapter = HTTPAdapter(max_retries=0)
+        self._warm_up_adapter.poolmanager = adapter.poolmanager
+
+    # Response cache
+
+    def _cache_key(self, *parts):
+        """Hash parts (bytes or str) together with the API key."""
+        h = hashlib.sha256(self.api_key.encode("utf-8"))
+        for part in parts:
+            h.update(part if isinstance(part, bytes) else part.encode("utf-8"))
+        return h.hexdigest()
+
+    def _cache_path(self, kind, key):
+        return os.path.join(self.cache_dir, kind, f"{key}.json")
+
+    def _cache_get(self, kind, key):
+        """Return a cached entry, or None if missing, stale, or unreadable."""
+        if not self.cache_dir:
+            return None
+        path = self._cache_path(kind, key)
+        try:
+            if time.time() - os.path.getmtime(path) > CACHE_MAX_AGE:
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _cache_put(self, kind, key, entry):
+        if not self.cache_dir:
+            return
+        path = self._cache_path(kind, key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp, path)
+        except OSError:
+            pass  # Caching is best-effort
+
+    def _cache_drop(self, kind, key):
+        if not self.cache_dir:
+            return
+        try:
+            os.remove(self._cache_path(kind, key))
+        except OSError:
+            pass
+
+    def _forget_task(self, task_id):
+        """Drop the cached task ID so the next identical request creates a new task."""
+        key = self._task_cache_keys.pop(task_id, None)
+        if key:
+            self._cache_drop("task", key)
+
+    def _forget_upload(self, image_token):
+        """Drop a cached upload token so the next run uploads the image again."""
+        key = self._upload_cache_keys.pop(image_token, None)
+        if key:
+            self._cache_drop("upload", key)
+
+    def _create_task_from_uploads(self, task_type, params, image_tokens):
+        """create_task, dropping cached upload tokens if the server rejects the task."""
+        try:
+            return self.create_task(task_type, params)
+        except (requests.HTTPError, RuntimeError):
+            for image_token in image_tokens:
+                self._forget_upload(image_token)
+            raise
+
+    @staticmethod
+    def _file_digest(path):
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                h.update(chunk)
+        return h.hexdigest()
+
+    # Background connection warm-up
+
+    @staticmethod
+    def _background(fn, *args):
+        """Run fn(*args) on a daemon thread, so it never holds the process open."""
+        thread = threading.Thread(target=fn, args=args, daemon=True,
+                                  name="tripo-prefetch")
+        thread.start()
+        return thread
+
+    def _warm_connection(self, url):
+        """
+        HEAD the model URL to open a pooled TLS connection, so the download
+        starts without a DNS lookup or handshake.
+        """
+        request = self.session.prepare_request(
+            requests.Request("HEAD", url, headers=_DOWNLOAD_HEADERS))
+        # Same verify/cert/proxy settings as session.get, so the connection
+        # lands in the pool the download will use
+        settings = self.session.merge_environment_settings(url, {}, None, None, None)
+        try:
+            resp = self._warm_up_adapter.send(request, timeout=WARM_UP_TIMEOUT, **settings)
+            resp.content  # Read the empty body so the connection returns to the pool
+        except requests.RequestException:
+            pass  # Best-effort; the real download will surface any error
+
+    def _prefetch_model_host(self, task_data, warmed_hosts):
+        """
+        Start warming the download host when a running task first reports a
+        partial model URL. warmed_hosts holds hosts already warmed during the
+        current poll. Once the task has succeeded the download follows at once,
+        so a warm-up then would only race it for a connection.
+        """
+        if task_data.get("status") == "success":
+            return
+        model_url = _model_url(task_data.get("output") or {})
+        if not model_url:
+            return
+        host = urlparse(model_url).hostname
+        if not host or host in warmed_hosts:
+            return
+        warmed_hosts.add(host)
+        self._background(self._warm_connection, model_url)
+
+    # API calls
 
     def upload_image(self, image_path):
-        """Upload an image file and get an image token."""
+        """Upload an image file and get an image token (cached by file content)."""
+        key = None
+        if self.cache_dir:
+            key = self._cache_key("upload", self._file_digest(image_path))
+        cached = self._cache_get("upload", key)
+        if cached:
+            self._upload_cache_keys[cached["image_token"]] = key
+            return cached["image_token"]
+
+        content_type = mimetypes.guess_type(image_path)[0] or "application/octet-stream"
         with open(image_path, "rb") as f:
+            body = _MultipartFileBody("file", f, os.path.basename(image_path), content_type)
             resp = self.session.post(
                 f"{API_BASE}/upload",
-                files={"file": (os.path.basename(image_path), f)},
+                data=body,
+                headers={"Content-Type": body.content_type},
             )
 
         resp.raise_for_status()
@@ -60,12 +323,26 @@ class TripoClient:
         if data.get("code") != 0:
             raise RuntimeError(f"Upload failed: {data.get('message', data)}")
 
-        return data["data"]["image_token"]
+        image_token = data["data"]["image_token"]
+        self._cache_put("upload", key, {"image_token": image_token})
+        return image_token
 
     def create_task(self, task_type, params):
-        """Create a generation task."""
+        """
+        Create a generation task.
+
+        The task ID is cached against the request body until the pipeline
+        finishes, so re-running an interrupted job resumes the existing task
+        instead of creating (and paying for) a new one.
+        """
         body = {"type": task_type, **params}
 
+        key = self._cache_key("task", json.dumps(body, sort_keys=True))
+        cached = self._cache_get("task", key)
+        if cached:
+            self._task_cache_keys[cached["task_id"]] = key
+            return cached["task_id"]
+
         resp = self.session.post(
             f"{API_BASE}/task",
             json=body,
@@ -77,15 +354,84 @@ class TripoClient:
         if data.get("code") != 0:
             raise RuntimeError(f"Task creation failed: {data.get('message', data)}")
 
-        return data["data"]["task_id"]
+        task_id = data["data"]["task_id"]
+        self._balance_cache = None  # The new task spent credits
+        self._task_cache_keys[task_id] = key
+        self._cache_put("task", key, {"task_id": task_id})
+        return task_id
+
+    def create_task_many(self, task_type, params_list):
+        """
+        Create several generation tasks concurrently.
+
+        Args:
+            task_type: Task type for every task
+            params_list: List of params dicts, one per task
 
-    def poll_task(self, task_id, poll_interval=3, timeout=600, callback=None):
+        Returns:
+            List of task IDs (or the exception raised creating that task),
+            in the same order as params_list
+        """
+        def create(params):
+            try:
+                return self.create_task(task_type, params)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=BATCH_WORKERS) as pool:
+            return list(pool.map(create, params_list))
+
+    def _fetch_task(self, task_id):
+        """GET a task's current data, raising if the request fails."""
+        resp = self.session.get(f"{API_BASE}/task/{task_id}")
+        if not resp.ok:
+            self._forget_task(task_id)
+        resp.raise_for_status()
+        data = resp.json()
+
+        if data.get("code") != 0:
+            self._forget_task(task_id)
+            raise RuntimeError(f"Poll failed: {data.get('message', data)}")
+
+        return data["data"]
+
+    def _raise_if_failed(self, task_id, task_data):
+        status = task_data.get("status")
+        if status in ("failed", "cancelled", "unknown"):
+            self._forget_task(task_id)
+            raise RuntimeError(
+                f"Task {status}: {task_data.get('message', 'no details')}"
+            )
+
+    @staticmethod
+    def _poll_delay(miss_count, progress, min_interval, max_interval):
+        """
+        Seconds to wait before the next poll.
+
+        Polls are sparse through the middle of a task (10-90%) even while
+        progress moves, and back off further while it stalls. Near the end
+        they drop to a second (or min_interval, if longer) so the result is
+        picked up promptly.
+        """
+        if progress >= 90:
+            return min(max_interval, max(min_interval, 1.0))
+        factor = 2 if progress < 10 else 5
+        return min(max_interval, min_interval * factor * 1.5 ** miss_count)
+
+    def poll_task(self, task_id, min_interval=1.0, max_interval=10.0, timeout=600,
+                  callback=None):
         """
         Poll a task until completion or failure.
+
+        Polls are spaced out while the task is in the 10-90% range and back off
+        exponentially while progress is unchanged. Near completion
+        (progress >= 90) they are kept about a second apart so the result is
+        picked up promptly.
         
         Args:
             task_id: The task ID to poll
-            poll_interval: Seconds between polls
+            min_interval: Shortest wait between polls, in seconds
+            max_interval: Longest wait between polls, in seconds
             timeout: Max seconds to wait
             callback: Optional function(progress, status) called on each poll
         
@@ -93,22 +439,22 @@ class TripoClient:
             Task data dict on success
         """
         start = time.time()
+        last_progress = None
+        miss_count = 0
+        warmed_hosts = set()
 
         while True:
             elapsed = time.time() - start
             if elapsed > timeout:
+                # A task that outlived the whole timeout is likely stuck; don't
+                # resume it on the next run
+                self._forget_task(task_id)
                 raise TimeoutError(f"Task {task_id} timed out after {timeout}s")
 
-            resp = self.session.get(f"{API_BASE}/task/{task_id}")
-            resp.raise_for_status()
-            data = resp.json()
-
-            if data.get("code") != 0:
-                raise RuntimeError(f"Poll failed: {data.get('message', data)}")
-
-            task_data = data["data"]
+            task_data = self._fetch_task(task_id)
             status = task_data.get("status")
             progress = task_data.get("progress", 0)
+            self._prefetch_model_host(task_data, warmed_hosts)
 
             if callback:
                 callback(progress, status)
@@ -116,46 +462,204 @@ class TripoClient:
             if status == "success":
                 return task_data
 
-            if status in ("failed", "cancelled", "unknown"):
-                raise RuntimeError(
-                    f"Task {status}: {task_data.get('message', 'no details')}"
-                )
+            self._raise_if_failed(task_id, task_data)
 
-            time.sleep(poll_interval)
+            if progress != last_progress:
+                last_progress = progress
+                miss_count = 0
+            else:
+                miss_count += 1
 
-    def download_model(self, task_data, output_path, fmt="glb"):
-        """Download the generated model from completed task data."""
-        output = task_data.get("output", {})
+            sleep = self._poll_delay(miss_count, progress, min_interval, max_interval)
+            # Don't oversleep the timeout
+            remaining = timeout - (time.time() - start)
+            time.sleep(max(0, min(sleep, remaining)))
 
-        # Try to get model URL
-        model_url = output.get("model")
-        if not model_url:
-            for key in ["pbr_model", "base_model", "model"]:
-                if key in output and output[key]:
-                    model_url = output[key]
-                    break
+    def poll_tasks(self, task_ids, min_interval=1.0, max_interval=10.0, timeout=600,
+                   callback=None):
+        """
+        Poll several tasks together until each completes or fails.
 
+        Each tick polls every pending task concurrently, then sleeps once for
+        the whole batch, backing off like poll_task while no task's progress
+        changes.
+
+        Args:
+            task_ids: Task IDs to poll
+            min_interval: Shortest wait between ticks, in seconds
+            max_interval: Longest wait between ticks, in seconds
+            timeout: Max seconds to wait for the whole batch, not counting time
+                the caller spends handling yielded results
+            callback: Optional function(task_id, progress, status) called on each poll
+
+        Yields:
+            (task_id, task_data, error) as each task finishes. On success error
+            is None; otherwise task_data is None and error is the exception.
+        """
+        pending = list(dict.fromkeys(task_ids))
+        last_progress = {}
+        miss_count = 0
+        warmed_hosts = set()
+        start = time.time()
+
+        with ThreadPoolExecutor(max_workers=BATCH_WORKERS) as pool:
+            while pending:
+                if time.time() - start > timeout:
+                    for task_id in pending:
+                        self._forget_task(task_id)
+                        yield task_id, None, TimeoutError(
+                            f"Task {task_id} timed out after {timeout}s")
+                    return
+
+                futures = {pool.submit(self._fetch_task, t): t for t in pending}
+                changed = False
+                max_progress = 0
+                finished = []
+
+                for future in as_completed(futures):
+                    task_id = futures[future]
+                    try:
+                        task_data = future.result()
+                    except Exception as e:
+                        pending.remove(task_id)
+                        finished.append((task_id, None, e))
+                        continue
+
+                    status = task_data.get("status")
+                    progress = task_data.get("progress", 0)
+                    self._prefetch_model_host(task_data, warmed_hosts)
+                    if callback:
+                        callback(task_id, progress, status)
+
+                    if status == "success":
+                        pending.remove(task_id)
+                        finished.append((task_id, task_data, None))
+                        continue
+
+                    try:
+                        self._raise_if_failed(task_id, task_data)
+                    except RuntimeError as e:
+                        pending.remove(task_id)
+                        finished.append((task_id, None, e))
+                        continue
+
+                    if last_progress.get(task_id) != progress:
+                        last_progress[task_id] = progress
+                        changed = True
+                    max_progress = max(max_progress, progress)
+
+                # Time the caller spends on results doesn't count against timeout
+                paused = time.time()
+                yield from finished
+                start += time.time() - paused
+
+                if not pending:
+                    return
+
+                miss_count = 0 if changed else miss_count + 1
+                sleep = self._poll_delay(miss_count, max_progress, min_interval, max_interval)
+                remaining = timeout - (time.time() - start)
+                time.sleep(max(0, min(sleep, remaining)))
+
+    def download_model(self, task_data, output_path, fmt="glb", download_callback=None):
+        """
+        Download the generated model from completed task data.
+
+        Args:
+            task_data: Task data dict returned by poll_task
+            output_path: Path for output model
+            fmt: Output format
+            download_callback: Optional function(downloaded, total) called at
+                most once per MiB and once at the end; total is 0 if unknown
+                or the response is compressed
+
+        Returns:
+            Path to downloaded model
+        """
+        model_url = _model_url(task_data.get("output", {}))
         if not model_url:
             raise RuntimeError("No model URL found in task output")
 
-        resp = self.session.get(model_url, stream=True)
+        resp = self.session.get(model_url, headers=_DOWNLOAD_HEADERS, stream=True)
         resp.raise_for_status()
 
-        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        _make_output_dir(output_path)
+
+        if download_callback is None:
+            # No progress to report: let urllib3 decode straight into the file
+            resp.raw.decode_content = True
+            with open(output_path, "wb") as f:
+                shutil.copyfileobj(resp.raw, f, self.download_chunk_size)
+            return output_path
+
+        # Content-Length counts encoded bytes but iter_content yields decoded
+        # ones, so a compressed response has no usable total
+        total = 0
+        if not resp.headers.get("Content-Encoding"):
+            total = int(resp.headers.get("Content-Length") or 0)
+        downloaded = 0
+        reported = None
+        next_report = 0
 
         with open(output_path, "wb") as f:
-            for chunk in resp.iter_content(chunk_size=8192):
+            for chunk in resp.iter_content(chunk_size=self.download_chunk_size):
                 f.write(chunk)
+                downloaded += len(chunk)
+                if downloaded >= next_report:
+                    download_callback(downloaded, total)
+                    reported = downloaded
+                    next_report = downloaded + DOWNLOAD_REPORT_BYTES
+
+        # Always report the final size, unless the last chunk just did
+        if reported != downloaded:
+            download_callback(downloaded, total)
 
         return output_path
 
-    def get_balance(self):
-        """Check remaining API credits."""
-        resp = self.session.get(f"{API_BASE}/user/balance")
+    def get_balance(self, max_age=BALANCE_CACHE_TTL):
+        """
+        Check remaining API credits.
+
+        Results are reused for max_age seconds. After that the request is
+        revalidated with the last ETag/Last-Modified, so an unchanged balance
+        comes back as a bodiless 304.
+
+        Args:
+            max_age: Seconds a previous result stays fresh (0 to always ask)
+
+        Returns:
+            Balance data dict
+        """
+        cached = self._balance_cache
+        if cached and time.time() - cached["time"] < max_age:
+            return cached["data"]
+
+        headers = {}
+        if cached:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        resp = self.session.get(f"{API_BASE}/user/balance", headers=headers)
+        if resp.status_code == 304 and cached:
+            cached["time"] = time.time()
+            return cached["data"]
+
+        if not resp.ok:
+            self._balance_cache = None
         resp.raise_for_status()
         data = resp.json()
         if data.get("code") != 0:
+            self._balance_cache = None
             raise RuntimeError(f"Balance check failed: {data.get('message', data)}")
+
+        self._balance_cache = {
+            "time": time.time(),
+            "data": data["data"],
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+        }
         return data["data"]
 
     # High-level convenience methods
@@ -170,7 +674,7 @@ class TripoClient:
                 params["geometry_quality"] = geometry_quality
 
     def image_to_3d(self, image_path, output_path, fmt="glb", callback=None,
-                    model_version=None, geometry_quality=None):
+                    model_version=None, geometry_quality=None, download_callback=None):
         """
         Full pipeline: image → 3D model.
         
@@ -181,22 +685,27 @@ class TripoClient:
             callback: Optional progress callback(progress, status)
             model_version: Model version (e.g. v3.1-20260211)
             geometry_quality: Geometry quality (standard or detailed)
+            download_callback: Optional download progress callback(downloaded, total)
         
         Returns:
             Path to downloaded model
         """
+        _make_output_dir(output_path)
         image_token = self.upload_image(image_path)
         
         params = {
             "file": {"type": "image_token", "file_token": image_token},
         }
         self._add_model_params(params, model_version, geometry_quality)
-        task_id = self.create_task(TASK_IMAGE_TO_MODEL, params)
+        task_id = self._create_task_from_uploads(TASK_IMAGE_TO_MODEL, params, [image_token])
         task_data = self.poll_task(task_id, callback=callback)
-        return self.download_model(task_data, output_path, fmt)
+        path = self.download_model(task_data, output_path, fmt,
+                                   download_callback=download_callback)
+        self._forget_task(task_id)
+        return path
 
     def text_to_3d(self, prompt, output_path, fmt="glb", callback=None,
-                   model_version=None, geometry_quality=None):
+                   model_version=None, geometry_quality=None, download_callback=None):
         """
         Full pipeline: text prompt → 3D model.
         
@@ -207,18 +716,24 @@ class TripoClient:
             callback: Optional progress callback(progress, status)
             model_version: Model version (e.g. v3.1-20260211)
             geometry_quality: Geometry quality (standard or detailed)
+            download_callback: Optional download progress callback(downloaded, total)
         
         Returns:
             Path to downloaded model
         """
+        _make_output_dir(output_path)
         params = {"prompt": prompt}
         self._add_model_params(params, model_version, geometry_quality)
         task_id = self.create_task(TASK_TEXT_TO_MODEL, params)
         task_data = self.poll_task(task_id, callback=callback)
-        return self.download_model(task_data, output_path, fmt)
+        path = self.download_model(task_data, output_path, fmt,
+                                   download_callback=download_callback)
+        self._forget_task(task_id)
+        return path
 
     def multiview_to_3d(self, image_paths, output_path, fmt="glb", callback=None,
-                        model_version=None, geometry_quality=None):
+                        model_version=None, geometry_quality=None,
+                        download_callback=None):
         """
         Full pipeline: multiple views → 3D model.
         
@@ -229,16 +744,175 @@ class TripoClient:
             callback: Optional progress callback(progress, status)
             model_version: Model version (e.g. v3.1-20260211)
             geometry_quality: Geometry quality (standard or detailed)
+            download_callback: Optional download progress callback(downloaded, total)
         
         Returns:
             Path to downloaded model
         """
+        _make_output_dir(output_path)
         tokens = [self.upload_image(p) for p in image_paths]
         
         params = {
             "files": [{"type": "image_token", "file_token": t} for t in tokens],
         }
         self._add_model_params(params, model_version, geometry_quality)
-        task_id = self.create_task(TASK_MULTIVIEW_TO_MODEL, params)
+        task_id = self._create_task_from_uploads(TASK_MULTIVIEW_TO_MODEL, params, tokens)
         task_data = self.poll_task(task_id, callback=callback)
-        return self.download_model(task_data, output_path, fmt)
+        path = self.download_model(task_data, output_path, fmt,
+                                   download_callback=download_callback)
+        self._forget_task(task_id)
+        return path
+
+    def image_to_3d_many(self, image_paths, output_dir, fmt="glb", callback=None,
+                         model_version=None, geometry_quality=None, timeout=600):
+        """
+        Batch pipeline: several images → one 3D model each, run concurrently.
+
+        Uploads and task creation run in parallel, all tasks are polled
+        together, and each model is downloaded as soon as its task finishes.
+        A failure on one image doesn't stop the others.
+
+        Args:
+            image_paths: Paths to input images
+            output_dir: Directory for output models, named after each image
+            fmt: Output format
+            callback: Optional progress callback(image_path, progress, status)
+            model_version: Model version (e.g. v3.1-20260211)
+            geometry_quality: Geometry quality (standard or detailed)
+            timeout: Max seconds to wait for the whole batch
+
+        Returns:
+            Dict mapping each image path to its output path, or to the
+            exception that stopped it
+        """
+        os.makedirs(output_dir, exist_ok=True)
+
+        output_paths = {}
+        used = set()
+        for path in dict.fromkeys(image_paths):
+            stem = Path(path).stem
+            name, n = stem, 1
+            while name in used:
+                n += 1
+                name = f"{stem}_{n}"
+            used.add(name)
+            output_paths[path] = os.path.join(output_dir, f"{name}.{fmt}")
+
+        def submit(path):
+            image_token = self.upload_image(path)
+            params = {
+                "file": {"type": "image_token", "file_token": image_token},
+            }
+            self._add_model_params(params, model_version, geometry_quality)
+            return self._create_task_from_uploads(TASK_IMAGE_TO_MODEL, params,
+                                                  [image_token])
+
+        results = {}
+        # Identical images resolve to the same cached task, so a task can
+        # serve several paths
+        task_paths = {}
+        with ThreadPoolExecutor(max_workers=BATCH_WORKERS) as pool:
+            futures = {pool.submit(submit, p): p for p in output_paths}
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    task_paths.setdefault(future.result(), []).append(path)
+                except Exception as e:
+                    results[path] = e
+
+        def task_callback(task_id, progress, status):
+            if callback:
+                for path in task_paths[task_id]:
+                    callback(path, progress, status)
+
+        def download(task_id, task_data):
+            ok = True
+            for path in task_paths[task_id]:
+                try:
+                    results[path] = self.download_model(task_data, output_paths[path], fmt)
+                except Exception as e:
+                    results[path] = e
+                    ok = False
+            if ok:
+                self._forget_task(task_id)
+
+        # Download on a pool so polling carries on while models arrive
+        with ThreadPoolExecutor(max_workers=BATCH_WORKERS) as pool:
+            for task_id, task_data, error in self.poll_tasks(
+                    list(task_paths), timeout=timeout, callback=task_callback):
+                if error:
+                    for path in task_paths[task_id]:
+                        results[path] = error
+                else:
+                    pool.submit(download, task_id, task_data)
+
+        return results
+
+
+# Shared clients, so repeated pipeline calls in one process reuse pooled
+# connections. Kept to the few most recently used keys so a server taking
+# keys from users (e.g. tripo-web) doesn't hold one per key ever typed.
+DEFAULT_CLIENTS_MAX = 4
+_default_clients = OrderedDict()
+_default_clients_lock = threading.Lock()
+
+
+def get_default_client(api_key=None, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Get the shared TripoClient for an API key, creating it on first use.
+
+    Only the DEFAULT_CLIENTS_MAX most recently used keys are kept.
+
+    Args:
+        api_key: Tripo API key. If not provided, reads from TRIPO_API_KEY env var.
+        cache_dir: Directory for cached upload tokens and task IDs, or None
+            to disable caching
+
+    Returns:
+        TripoClient
+    """
+    api_key = api_key or os.environ.get("TRIPO_API_KEY")
+    key = (api_key, cache_dir)
+    with _default_clients_lock:
+        client = _default_clients.get(key)
+        if client is None:
+            client = TripoClient(api_key, cache_dir=cache_dir)
+            _default_clients[key] = client
+            while len(_default_clients) > DEFAULT_CLIENTS_MAX:
+                _default_clients.popitem(last=False)
+        else:
+            _default_clients.move_to_end(key)
+    return client
+
+
+def image_to_3d(image_path, output_path, fmt="glb", callback=None, client=None,
+                api_key=None, **kwargs):
+    """
+    Full pipeline: image → 3D model, using client or the shared default client.
+
+    Extra keyword arguments are passed to TripoClient.image_to_3d.
+    """
+    client = client or get_default_client(api_key)
+    return client.image_to_3d(image_path, output_path, fmt, callback, **kwargs)
+
+
+def text_to_3d(prompt, output_path, fmt="glb", callback=None, client=None,
+               api_key=None, **kwargs):
+    """
+    Full pipeline: text prompt → 3D model, using client or the shared default client.
+
+    Extra keyword arguments are passed to TripoClient.text_to_3d.
+    """
+    client = client or get_default_client(api_key)
+    return client.text_to_3d(prompt, output_path, fmt, callback, **kwargs)
+
+
+def multiview_to_3d(image_paths, output_path, fmt="glb", callback=None, client=None,
+                    api_key=None, **kwargs):
+    """
+    Full pipeline: multiple views → 3D model, using client or the shared default client.
+
+    Extra keyword arguments are passed to TripoClient.multiview_to_3d.
+    """
+    client = client or get_default_client(api_key)
+    return client.multiview_to_3d(image_paths, output_path, fmt, callback, **kwargs)
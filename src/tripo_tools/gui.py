@@ -18,14 +18,16 @@ try:
         QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
         QLabel, QLineEdit, QPushButton, QComboBox, QTextEdit, QFileDialog,
         QGroupBox, QFormLayout, QProgressBar, QMessageBox, QGridLayout,
-        QTabWidget, QSpinBox,
+        QTabWidget, QSpinBox, QCheckBox,
     )
 except ImportError:
     print("PySide6 not installed. Run: pip install PySide6")
     print("Or install with GUI support: pip install tripo-tools[gui]")
     sys.exit(1)
 
-from .client import TripoClient, MODEL_VERSIONS, GEOMETRY_QUALITIES
+from .client import (
+    get_default_client, MODEL_VERSIONS, GEOMETRY_QUALITIES, DEFAULT_CACHE_DIR,
+)
 
 OUTPUT_FORMATS = ["glb", "fbx", "obj", "stl", "usdz"]
 SUPPORTED_IMAGES = "Images (*.png *.jpg *.jpeg *.webp *.bmp);;All Files (*)"
@@ -245,6 +247,11 @@ class TripoGUI(QMainWindow):
         self.timeout_spin.setRange(60, 1800)
         self.timeout_spin.setValue(600)
         options_row.addWidget(self.timeout_spin)
+        options_row.addSpacing(20)
+        self.cache_check = QCheckBox("Use cache")
+        self.cache_check.setChecked(True)
+        self.cache_check.setToolTip("Reuse cached uploads and resume interrupted tasks")
+        options_row.addWidget(self.cache_check)
         options_row.addStretch()
         output_layout.addRow(options_row)
 
@@ -329,7 +336,7 @@ class TripoGUI(QMainWindow):
 
     def _balance_worker(self, api_key):
         try:
-            client = TripoClient(api_key)
+            client = get_default_client(api_key)
             balance = client.get_balance()
             self.signals.balance.emit(json.dumps(balance, indent=2))
         except Exception as e:
@@ -393,16 +400,18 @@ class TripoGUI(QMainWindow):
 
         self.worker_thread = threading.Thread(
             target=self._generate_worker,
-            args=(api_key, mode, payload, output, fmt, timeout, model_ver, geo_quality),
+            args=(api_key, mode, payload, output, fmt, timeout, model_ver, geo_quality,
+                  self.cache_check.isChecked()),
             daemon=True,
         )
         self.worker_thread.start()
         self._save_settings()
 
     def _generate_worker(self, api_key, mode, payload, output, fmt, timeout,
-                         model_version=None, geometry_quality=None):
+                         model_version=None, geometry_quality=None, use_cache=True):
         try:
-            client = TripoClient(api_key)
+            cache_dir = DEFAULT_CACHE_DIR if use_cache else None
+            client = get_default_client(api_key, cache_dir=cache_dir)
             mk = {"model_version": model_version, "geometry_quality": geometry_quality}
 
             def progress_callback(progress, status):
@@ -450,11 +459,14 @@ class TripoGUI(QMainWindow):
         key = self.api_key_input.text().strip()
         if key:
             self.settings.setValue("api_key", key)
+        self.settings.setValue("use_cache", self.cache_check.isChecked())
 
     def _load_settings(self):
         key = self.settings.value("api_key", "")
         if key:
             self.api_key_input.setText(key)
+        use_cache = self.settings.value("use_cache", True)
+        self.cache_check.setChecked(use_cache not in (False, "false"))
 
 
 def main():
@@ -18,7 +18,12 @@ try:
 except ImportError:
     gr = None
 
-from .client import TripoClient
+from .client import get_default_client, DEFAULT_CACHE_DIR
+
+
+def _get_client(api_key, use_cache):
+    """Get the shared client for api_key, with or without the on-disk cache."""
+    return get_default_client(api_key, cache_dir=DEFAULT_CACHE_DIR if use_cache else None)
 
 
 def check_gradio():
@@ -29,7 +34,7 @@ def check_gradio():
         sys.exit(1)
 
 
-def generate_from_image(image_path, output_format, api_key, progress=None):
+def generate_from_image(image_path, output_format, api_key, use_cache=True, progress=None):
     """Generate 3D model from a single image."""
     if not api_key:
         return None, "❌ Error: API key required"
@@ -38,7 +43,7 @@ def generate_from_image(image_path, output_format, api_key, progress=None):
         return None, "❌ Error: Please upload an image"
     
     try:
-        client = TripoClient(api_key)
+        client = _get_client(api_key, use_cache)
         
         if progress:
             progress(0.1, desc="Uploading image...")
@@ -61,7 +66,7 @@ def generate_from_image(image_path, output_format, api_key, progress=None):
         return None, f"❌ Error: {str(e)}"
 
 
-def generate_from_text(prompt, output_format, api_key, progress=None):
+def generate_from_text(prompt, output_format, api_key, use_cache=True, progress=None):
     """Generate 3D model from text prompt."""
     if not api_key:
         return None, "❌ Error: API key required"
@@ -70,7 +75,7 @@ def generate_from_text(prompt, output_format, api_key, progress=None):
         return None, "❌ Error: Please enter a prompt"
     
     try:
-        client = TripoClient(api_key)
+        client = _get_client(api_key, use_cache)
         
         if progress:
             progress(0.1, desc="Creating task...")
@@ -93,7 +98,8 @@ def generate_from_text(prompt, output_format, api_key, progress=None):
         return None, f"❌ Error: {str(e)}"
 
 
-def generate_from_multiview(front, back, left, right, output_format, api_key, progress=None):
+def generate_from_multiview(front, back, left, right, output_format, api_key,
+                            use_cache=True, progress=None):
     """Generate 3D model from 4 views."""
     if not api_key:
         return None, "❌ Error: API key required"
@@ -103,7 +109,7 @@ def generate_from_multiview(front, back, left, right, output_format, api_key, pr
         return None, "❌ Error: All 4 views required (front, back, left, right)"
     
     try:
-        client = TripoClient(api_key)
+        client = _get_client(api_key, use_cache)
         
         if progress:
             progress(0.1, desc="Uploading images...")
@@ -132,7 +138,7 @@ def check_balance(api_key):
         return "❌ Enter API key first"
     
     try:
-        client = TripoClient(api_key)
+        client = get_default_client(api_key)
         balance = client.get_balance()
         return f"💰 Balance: {balance}"
     except Exception as e:
@@ -168,6 +174,10 @@ def build_interface():
             value="glb",
             label="Output Format",
         )
+        use_cache = gr.Checkbox(
+            value=True,
+            label="Reuse cached uploads and resume interrupted tasks",
+        )
         
         with gr.Tabs():
             # Tab 1: Image to 3D
@@ -189,7 +199,7 @@ def build_interface():
                 
                 image_btn.click(
                     generate_from_image,
-                    inputs=[image_input, output_format, api_key],
+                    inputs=[image_input, output_format, api_key, use_cache],
                     outputs=[image_output, image_status],
                 )
             
@@ -212,7 +222,7 @@ def build_interface():
                 
                 text_btn.click(
                     generate_from_text,
-                    inputs=[prompt_input, output_format, api_key],
+                    inputs=[prompt_input, output_format, api_key, use_cache],
                     outputs=[text_output, text_status],
                 )
             
@@ -235,7 +245,8 @@ def build_interface():
                 
                 multi_btn.click(
                     generate_from_multiview,
-                    inputs=[front_img, back_img, left_img, right_img, output_format, api_key],
+                    inputs=[front_img, back_img, left_img, right_img, output_format, api_key,
+                            use_cache],
                     outputs=[multi_output, multi_status],
                 )
         